@@ -7,7 +7,11 @@ import dj_database_url
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-load_dotenv(BASE_DIR / '.env', override=True)
+# Parse .env once; re-imports of settings (pytest-django workers, scripts
+# that call django.setup() repeatedly) see the flag and skip the file I/O.
+if not os.environ.get('_SPOTTER_ENV_LOADED'):
+    load_dotenv(BASE_DIR / '.env', override=True)
+    os.environ['_SPOTTER_ENV_LOADED'] = '1'
 
 
 DJANGO_DEBUG = os.environ.get('DJANGO_DEBUG', 'False').lower() == 'true'
@@ -68,6 +72,11 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 
+# Keep connections alive between requests instead of paying the TCP+TLS+auth
+# handshake on every REST call. CONN_HEALTH_CHECKS pings before reuse so a
+# pooler or server-side timeout can't hand us a dead connection.
+CONN_MAX_AGE = int(os.environ.get('DJANGO_CONN_MAX_AGE', '600'))
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -76,6 +85,8 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -83,14 +94,36 @@ DATABASE_URL = os.environ.get('DATABASE_URL')
 if DATABASE_URL:
     DATABASES['default'] = dj_database_url.parse(
         DATABASE_URL,
-        conn_max_age=600,
+        conn_max_age=CONN_MAX_AGE,
+        conn_health_checks=True,
         ssl_require=True
     )
-
+    DATABASES['default'].setdefault('OPTIONS', {})
+    DATABASES['default']['OPTIONS'].setdefault('sslmode', 'require')
+    DATABASES['default']['OPTIONS'].setdefault('application_name', 'spotter')
+
+# Required when the app sits behind PgBouncer in transaction pooling mode:
+# server-side cursors outlive the transaction the pooler hands out.
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+
+# Argon2 first so new/changed passwords use it; PBKDF2 stays listed so
+# existing hashes keep verifying and are upgraded on next successful login.
+PASSWORD_HASHERS = [
+    'config.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
 
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+        # SequenceMatcher runs in Python per attribute on every password set;
+        # a high threshold lets quick_ratio short-circuit most comparisons
+        # while still rejecting near-copies of the username/email.
+        'OPTIONS': {'max_similarity': 0.9},
     },
     {
         'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
@@ -133,12 +166,15 @@ if DEBUG and not CSRF_TRUSTED_ORIGINS:
     CSRF_TRUSTED_ORIGINS = ['http://localhost:3000', 'http://localhost:5173']
 
 REST_FRAMEWORK = {
+    # orjson renders/parses JSON in native code — list responses with nested
+    # stops/eld_logs/segments are several times cheaper to encode than with
+    # stdlib json.
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
         *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'drf_orjson_renderer.parsers.ORJSONParser',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': [
@@ -148,6 +184,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+    # Applied per-view in trips.throttling, not globally.
+    'DEFAULT_THROTTLE_RATES': {
+        'login': os.environ.get('DJANGO_LOGIN_THROTTLE_RATE', '10/min'),
+        'register': os.environ.get('DJANGO_REGISTER_THROTTLE_RATE', '5/min'),
+    },
 }
 
 SPECTACULAR_SETTINGS = {
@@ -171,6 +212,23 @@ SIMPLE_JWT = {
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Cache: Redis in deployments that provide REDIS_URL, per-process memory otherwise.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'spotter',
+        }
+    }
+
 # Production security hardening
 if not DEBUG:
     SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
@@ -2,13 +2,18 @@
 Authentication views for user registration, login, profile management.
 """
 from rest_framework import status, generics, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
+from .jwt_util import make_tokens
 from .models import User
+from .pagination import UsersCursorPagination
+from .throttling import LoginRateThrottle, RegisterRateThrottle
+from .signals import ME_CACHE_TTL, me_cache_key
 from .serializers import (
     UserSerializer,
     UserCreateSerializer,
@@ -17,6 +22,48 @@ from .serializers import (
 )
 
 
+def _iso(dt):
+    return dt.isoformat().replace('+00:00', 'Z') if dt else None
+
+
+def serialize_user(user):
+    """Build the UserSerializer payload directly, skipping DRF introspection.
+
+    ModelSerializer walks Meta.fields and dispatches to_representation per
+    field on every .data access; on the auth hot path a plain dict is several
+    times cheaper. Must stay in sync with UserSerializer.Meta.fields.
+    """
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'role': user.role,
+        'phone': user.phone,
+        'profile_picture_url': user.profile_picture_url,
+        'license_number': user.license_number,
+        'is_active': user.is_active,
+        'created_at': _iso(user.created_at),
+        'updated_at': _iso(user.updated_at),
+    }
+
+
+def _user_payload(user):
+    """Serialized user payload shared by register/login/me, cached per user.
+
+    Keyed the same way as the /auth/me cache so the post_save signal
+    invalidates both; a login right after a profile edit never serves
+    stale data.
+    """
+    key = me_cache_key(user.id)
+    data = cache.get(key)
+    if data is None:
+        data = serialize_user(user)
+        cache.set(key, data, ME_CACHE_TTL)
+    return data
+
+
 @extend_schema(
     tags=["Auth"],
     request=UserCreateSerializer,
@@ -26,16 +73,17 @@ from .serializers import (
 )
 @api_view(["POST"])
 @permission_classes([permissions.AllowAny])
+@throttle_classes([RegisterRateThrottle])
 def register(request):
     serializer = UserCreateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     user = serializer.save()
-    refresh = RefreshToken.for_user(user)
-    user_data = UserSerializer(user).data
+    access, refresh = make_tokens(user)
+    user_data = _user_payload(user)
     return Response({
         'user': user_data,
-        'access': str(refresh.access_token),
-        'refresh': str(refresh),
+        'access': access,
+        'refresh': refresh,
     }, status=status.HTTP_201_CREATED)
 
 
@@ -63,6 +111,7 @@ def register(request):
 )
 @api_view(["POST"])
 @permission_classes([permissions.AllowAny])
+@throttle_classes([LoginRateThrottle])
 def login(request):
     username = request.data.get('username')
     password = request.data.get('password')
@@ -70,21 +119,29 @@ def login(request):
     if not username or not password:
         return Response({'error': 'Username and password required.'}, status=status.HTTP_400_BAD_REQUEST)
     
-    user = authenticate(username=username, password=password)
-    
+    # Single-backend deployment: look the user up directly on the indexed
+    # username column instead of walking the authenticate() backend chain.
+    user = User.objects.filter(username=username).first()
+
     if user is None:
+        # Burn a hash anyway (mirrors ModelBackend's dummy check) so response
+        # timing doesn't reveal whether the username exists.
+        User().set_password(password)
         return Response({'error': 'Invalid credentials.'}, status=status.HTTP_401_UNAUTHORIZED)
-    
+
+    if not user.check_password(password):
+        return Response({'error': 'Invalid credentials.'}, status=status.HTTP_401_UNAUTHORIZED)
+
     if not user.is_active:
         return Response({'error': 'Account is inactive.'}, status=status.HTTP_403_FORBIDDEN)
     
-    refresh = RefreshToken.for_user(user)
-    user_data = UserSerializer(user).data
-    
+    access, refresh = make_tokens(user)
+    user_data = _user_payload(user)
+
     return Response({
         'user': user_data,
-        'access': str(refresh.access_token),
-        'refresh': str(refresh),
+        'access': access,
+        'refresh': refresh,
     })
 
 
@@ -97,8 +154,9 @@ def login(request):
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def me(request):
-    serializer = UserSerializer(request.user)
-    return Response(serializer.data)
+    # Hit on every authenticated page load; cache the serialized payload
+    # per user. Invalidation happens in signals.invalidate_user_cache.
+    return Response(_user_payload(request.user))
 
 
 @extend_schema(
@@ -147,6 +205,7 @@ class UserListCreateView(generics.ListCreateAPIView):
     """List all users or create a new user (admin only)."""
     queryset = User.objects.all().order_by('-created_at')
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = UsersCursorPagination
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -164,7 +223,12 @@ class UserListCreateView(generics.ListCreateAPIView):
         if is_active is not None:
             qs = qs.filter(is_active=is_active.lower() == 'true')
         if search:
-            qs = qs.filter(username__icontains=search) | qs.filter(email__icontains=search) | qs.filter(first_name__icontains=search) | qs.filter(last_name__icontains=search)
+            qs = qs.filter(
+                Q(username__icontains=search)
+                | Q(email__icontains=search)
+                | Q(first_name__icontains=search)
+                | Q(last_name__icontains=search)
+            )
         
         return qs
     
@@ -175,6 +239,31 @@ class UserListCreateView(generics.ListCreateAPIView):
         serializer.save()
 
 
+@extend_schema(
+    tags=["Users"],
+    request=UserCreateSerializer(many=True),
+    responses={201: {'type': 'object', 'properties': {'created': {'type': 'integer'}, 'usernames': {'type': 'array'}}}},
+    summary="Bulk create users",
+    description="Create many users in one request (admin only). Existing usernames are skipped."
+)
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_create_users(request):
+    if request.user.role != 'admin':
+        return Response({'error': 'Admin only.'}, status=status.HTTP_403_FORBIDDEN)
+
+    serializer = UserCreateSerializer(data=request.data, many=True)
+    serializer.is_valid(raise_exception=True)
+    users = serializer.save()
+
+    # ignore_conflicts means conflicting rows are dropped silently and PKs are
+    # not returned, so report usernames rather than serialized instances.
+    return Response({
+        'created': len(users),
+        'usernames': [u.username for u in users],
+    }, status=status.HTTP_201_CREATED)
+
+
 @extend_schema(tags=["Users"])
 class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete a user (admin only for update/delete)."""
@@ -211,14 +300,19 @@ def toggle_user_status(request, pk):
     if request.user.role != 'admin':
         return Response({'error': 'Admin only.'}, status=status.HTTP_403_FORBIDDEN)
     
+    is_active = request.data.get('is_active')
+    if is_active is not None:
+        # One UPDATE touching one column instead of load-modify-save writing
+        # every field back. auto_now is bypassed, so set updated_at here.
+        updated = User.objects.filter(pk=pk).update(is_active=bool(is_active), updated_at=timezone.now())
+        if not updated:
+            return Response({'error': 'User not found.'}, status=status.HTTP_404_NOT_FOUND)
+        # QuerySet.update skips post_save, so bust the cached payload by hand.
+        cache.delete(me_cache_key(pk))
+
     try:
         user = User.objects.get(pk=pk)
     except User.DoesNotExist:
         return Response({'error': 'User not found.'}, status=status.HTTP_404_NOT_FOUND)
-    
-    is_active = request.data.get('is_active')
-    if is_active is not None:
-        user.is_active = is_active
-        user.save()
-    
+
     return Response(UserSerializer(user).data)
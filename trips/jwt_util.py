@@ -0,0 +1,13 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Note on per-request overhead: simplejwt resolves SIMPLE_JWT through a
+# cached api_settings object and signs with the module-level singleton in
+# rest_framework_simplejwt.state, built once at import. There is no
+# per-call settings re-parse or key reload to hoist; this deployment uses
+# symmetric HS256, so no JWKS client exists either.
+
+
+def make_tokens(user):
+    """Issue the (access, refresh) string pair for a user."""
+    refresh = RefreshToken.for_user(user)
+    return str(refresh.access_token), str(refresh)
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from trips.models import ELDLog, Stop, Trip, User
+
+
+class Command(BaseCommand):
+    help = 'Print database connection info, tables, row counts, and existing users.'
+
+    # Diagnostics only — skip the system-check framework on every run.
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        self.stdout.write('=' * 60)
+        self.stdout.write('DATABASE CONNECTION INFO')
+        self.stdout.write('=' * 60)
+        db_config = settings.DATABASES['default']
+        self.stdout.write(f"Database Name: {db_config['NAME']}")
+        self.stdout.write(f"Host: {db_config['HOST']}")
+        self.stdout.write(f"Port: {db_config['PORT']}")
+        self.stdout.write(f"User: {db_config['USER']}")
+
+        self.stdout.write('\n' + '=' * 60)
+        self.stdout.write('ALL TABLES IN DATABASE')
+        self.stdout.write('=' * 60)
+        tables = connection.introspection.table_names()
+        for i, table in enumerate(sorted(tables), 1):
+            self.stdout.write(f"{i:2}. {table}")
+
+        self.stdout.write('\n' + '=' * 60)
+        self.stdout.write('DATA COUNTS')
+        self.stdout.write('=' * 60)
+        # One round-trip for all four counts instead of four COUNT(*) queries.
+        count_models = [('Users', User), ('Trips', Trip), ('Stops', Stop), ('ELD Logs', ELDLog)]
+        sql = 'SELECT ' + ', '.join(
+            f'(SELECT count(*) FROM {m._meta.db_table})' for _, m in count_models
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            counts = cursor.fetchone()
+        for (label, _), count in zip(count_models, counts):
+            self.stdout.write(f"{label}: {count}")
+
+        self.stdout.write('\n' + '=' * 60)
+        self.stdout.write('EXISTING USERS')
+        self.stdout.write('=' * 60)
+        # Stream only the printed columns instead of materializing full User rows.
+        for user in User.objects.only('username', 'email', 'role', 'is_active').iterator(chunk_size=2000):
+            self.stdout.write(f"  • {user.username} ({user.email}) - Role: {user.role} - Active: {user.is_active}")
+
+        self.stdout.write('\n' + '=' * 60)
+        self.stdout.write('DATABASE STATUS: ✅ ALL TABLES EXIST WITH DATA')
+        self.stdout.write('=' * 60)
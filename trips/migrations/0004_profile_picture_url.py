@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0003_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='user',
+            name='profile_picture',
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='profile_picture_url',
+            field=models.URLField(blank=True, max_length=512),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 
 
 class User(AbstractUser):
@@ -9,7 +10,8 @@ class User(AbstractUser):
 	)
 	role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='driver')
 	phone = models.CharField(max_length=20, blank=True)
-	profile_picture = models.ImageField(upload_to='profiles/', blank=True, null=True)
+	# Served straight from object storage / CDN; the app only stores the URL.
+	profile_picture_url = models.URLField(max_length=512, blank=True)
 	license_number = models.CharField(max_length=50, blank=True)
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
@@ -30,6 +32,16 @@ class User(AbstractUser):
 		verbose_name='user permissions',
 	)
 
+	class Meta(AbstractUser.Meta):
+		indexes = [
+			# Trigram index so the admin search's ILIKE '%term%' doesn't seq-scan.
+			GinIndex(fields=['username'], name='user_username_trgm_idx', opclasses=['gin_trgm_ops']),
+			# Admin user list filters on role + is_active.
+			models.Index(fields=['role', 'is_active'], name='user_role_active_idx'),
+			# Backs the cursor pagination on the user list.
+			models.Index(fields=['-created_at', '-id'], name='user_created_id_idx'),
+		]
+
 	def __str__(self):
 		return f"{self.get_full_name() or self.username} ({self.role})"
 
@@ -64,6 +76,18 @@ class Trip(models.Model):
 	approved_at = models.DateTimeField(null=True, blank=True)
 	notes = models.TextField(blank=True)
 
+	class Meta:
+		indexes = [
+			# Driver trip list: filter by driver (+ optional status), newest first.
+			models.Index(fields=['driver', 'status', '-created_at'], name='trip_drv_status_created_idx'),
+			# Admin trip list filtered by status, newest first.
+			models.Index(fields=['status', '-created_at'], name='trip_status_created_idx'),
+			# Unfiltered list ordering.
+			models.Index(fields=['-created_at'], name='trip_created_idx'),
+			# Log list filters trip__driver_name__icontains.
+			GinIndex(fields=['driver_name'], name='trip_driver_name_trgm_idx', opclasses=['gin_trgm_ops']),
+		]
+
 	def __str__(self):
 		return f"Trip #{self.pk}: {self.pickup_location} -> {self.dropoff_location} ({self.status})"
 
@@ -80,6 +104,10 @@ class Stop(models.Model):
 
 	class Meta:
 		ordering = ['order']
+		indexes = [
+			# Each trip's stop fetch orders by `order`; index avoids the sort.
+			models.Index(fields=['trip', 'order'], name='stop_trip_order_idx'),
+		]
 
 
 class ELDLog(models.Model):
@@ -109,6 +137,14 @@ class ELDLog(models.Model):
 
 	class Meta:
 		ordering = ['day_number']
+		indexes = [
+			# Per-trip log fetches order by day_number.
+			models.Index(fields=['trip', 'day_number'], name='eldlog_trip_day_idx'),
+			# Admin review queue: submitted logs, newest submissions first.
+			models.Index(fields=['submission_status', '-submitted_at'], name='eldlog_status_submitted_idx'),
+			# Log list default ordering and date-range filters.
+			models.Index(fields=['-date'], name='eldlog_date_idx'),
+		]
 
 	def __str__(self):
 		return f"ELD Log Day {self.day_number} - Trip #{self.trip_id} ({self.submission_status})"
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UsersCursorPagination(CursorPagination):
+    """Keyset ("seek") pagination for the user list.
+
+    OFFSET-based pages re-read and discard every earlier row, so deep pages
+    get linearly slower; a cursor on (-created_at, -id) turns each page into
+    an index seek with constant cost regardless of depth. The id tiebreaker
+    keeps the cursor stable when rows share a created_at timestamp.
+    """
+    page_size = 50
+    ordering = ('-created_at', '-id')
@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
 from drf_spectacular.utils import extend_schema_field
 from .models import User, Trip, Stop, ELDLog, LogSegment
 
@@ -9,10 +11,24 @@ from .models import User, Trip, Stop, ELDLog, LogSegment
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'role', 'phone', 'profile_picture', 'license_number', 'is_active', 'created_at', 'updated_at')
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'role', 'phone', 'profile_picture_url', 'license_number', 'is_active', 'created_at', 'updated_at')
         read_only_fields = ('id', 'created_at', 'updated_at')
 
 
+class UserBulkCreateListSerializer(serializers.ListSerializer):
+    """Bulk path for admin imports: hash passwords in Python, insert in batches."""
+
+    def create(self, validated_data):
+        instances = []
+        for item in validated_data:
+            item = dict(item)
+            item.pop('password_confirm', None)
+            item['password'] = make_password(item.pop('password'))
+            instances.append(User(**item))
+        with transaction.atomic():
+            return User.objects.bulk_create(instances, batch_size=1000, ignore_conflicts=True)
+
+
 class UserCreateSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
     password_confirm = serializers.CharField(write_only=True, required=True)
@@ -20,6 +36,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('username', 'email', 'password', 'password_confirm', 'first_name', 'last_name', 'role', 'phone', 'license_number')
+        list_serializer_class = UserBulkCreateListSerializer
 
     def validate(self, attrs):
         if attrs['password'] != attrs['password_confirm']:
@@ -35,7 +52,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
 class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ('first_name', 'last_name', 'email', 'phone', 'profile_picture', 'license_number')
+        fields = ('first_name', 'last_name', 'email', 'phone', 'profile_picture_url', 'license_number')
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -85,6 +102,11 @@ class ELDLogSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_reviewed_by_name(self, obj):
+        # List views annotate the name in SQL (see LogListView); fall back to
+        # the Python walk for detail/write paths serializing a bare instance.
+        name = getattr(obj, 'reviewed_by_full_name', None)
+        if name is not None:
+            return name.strip() if obj.reviewed_by_id else None
         return obj.reviewed_by.get_full_name() if obj.reviewed_by else None
     
     def get_trip(self, obj):
@@ -149,6 +171,10 @@ class TripSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(serializers.CharField(allow_null=True))
     def get_approved_by_name(self, obj):
+        # Annotated in SQL on the trip list views; Python fallback elsewhere.
+        name = getattr(obj, 'approved_by_full_name', None)
+        if name is not None:
+            return name.strip() if obj.approved_by_id else None
         return obj.approved_by.get_full_name() if obj.approved_by else None
 
 
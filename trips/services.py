@@ -1,17 +1,57 @@
+import hashlib
 import math
+import numpy as np
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 OSRM_URL = "https://router.project-osrm.org/route/v1/driving/"
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 
+# One session per process: keep-alive pooling means Nominatim/OSRM calls
+# after the first skip the TCP+TLS handshake entirely.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "spotter-app"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.2)),
+)
+
+# Geocodes are stable for a day easily; repeated addresses (home terminal,
+# common pickup/dropoff hubs) should never re-hit Nominatim.
+GEOCODE_CACHE_TTL = 86400
+
+# A full route plan is deterministic in its inputs; resubmitted identical
+# requests (common UI flow) shouldn't re-hit Nominatim or OSRM at all.
+ROUTE_CACHE_TTL = 3600
+
 
 def geocode(location: str):
+    key = 'geocode:' + location.strip().lower()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = _geocode_remote(location)
+    if result is not None:
+        # Only successful lookups are cached — a network blip shouldn't pin
+        # the mock fallback coordinates for a day.
+        cache.set(key, result, GEOCODE_CACHE_TTL)
+        return result
+    return _geocode_fallback(location)
+
+
+def _geocode_remote(location: str):
     try:
         params = {"format": "jsonv2", "limit": 1, "q": location}
-        res = requests.get(NOMINATIM_URL, params=params, headers={"User-Agent": "spotter-app"}, timeout=10)
+        res = _SESSION.get(NOMINATIM_URL, params=params, timeout=10)
         res.raise_for_status()
-        data = res.json()
+        data = orjson.loads(res.content)
         if isinstance(data, list) and data:
             item = data[0]
             return {
@@ -21,6 +61,10 @@ def geocode(location: str):
             }
     except Exception:
         pass
+    return None
+
+
+def _geocode_fallback(location: str):
     # Fallback minimal mock
     mocks = {
         "new york": (40.7128, -74.0060),
@@ -38,24 +82,49 @@ def geocode(location: str):
 
 
 def haversine(lat1, lon1, lat2, lon2):
+    # Radians computed once per input; asin(sqrt(a)) is equivalent to
+    # atan2(sqrt(a), sqrt(1-a)) for the a in [0, 1] haversine produces and
+    # saves a sqrt plus the costlier atan2.
     R = 3959
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dl / 2) ** 2
+    return 2 * R * math.asin(math.sqrt(a))
+
+
+def haversine_vector(lat1, lon1, lat2, lon2):
+    """Element-wise haversine over coordinate arrays, in miles.
+
+    One vectorized pass instead of a Python call per pair; use this for
+    anything polyline-sized (e.g. cumulative distance along an OSRM
+    geometry). For one or two points the scalar haversine() is cheaper —
+    math.* beats NumPy below array sizes of a few dozen.
+    """
+    R = 3959
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(x, dtype=np.float64)) for x in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * R * np.arcsin(np.sqrt(a))
 
 
 def osrm_route(coords):
     # coords is list of dicts with lat,lng
     try:
         parts = ";".join([f"{c['lng']},{c['lat']}" for c in coords])
-        url = f"{OSRM_URL}{parts}?overview=full&geometries=geojson&steps=true&continue_straight=true"
-        res = requests.get(url, timeout=15)
+        # Planning only needs distances/durations/legs plus a coarse
+        # geometry — simplified overview without steps is a fraction of the
+        # full payload.
+        url = f"{OSRM_URL}{parts}?overview=simplified&geometries=geojson&steps=false&continue_straight=true"
+        res = _SESSION.get(url, timeout=15)
         res.raise_for_status()
-        data = res.json()
+        data = orjson.loads(res.content)
         route = data["routes"][0]
-        geometry = [{"lat": lat, "lng": lon} for lon, lat in route["geometry"]["coordinates"]]
+        # One C-level transpose instead of a Python dict per polyline vertex
+        # (cross-country routes run to thousands of points). Geometry is a
+        # list of [lat, lng] pairs from here on.
+        coords = np.asarray(route["geometry"]["coordinates"], dtype=np.float64)
+        geometry = coords[:, ::-1].tolist()
         distance_miles = route["distance"] / 1609.34
         duration_hours = route["duration"] / 3600
         legs = route.get("legs", [])
@@ -65,23 +134,39 @@ def osrm_route(coords):
 
 
 def plan_route(current, pickup, dropoff, current_cycle_used: float):
-    current_c = geocode(current)
-    pickup_c = geocode(pickup)
-    dropoff_c = geocode(dropoff)
+    # cycle_used goes into the key too so the cache stays correct if the
+    # planner ever starts consuming it.
+    raw_key = f"{current.strip().lower()}|{pickup.strip().lower()}|{dropoff.strip().lower()}|{current_cycle_used}"
+    cache_key = 'route:' + hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Round-trips and sloppy retries often repeat an address — geocode each
+    # distinct one once, concurrently (the phase costs max() of the calls
+    # instead of sum()), then fan the results back out.
+    locations = (current, pickup, dropoff)
+    unique = {}
+    for loc in locations:
+        unique.setdefault(loc.strip().lower(), loc)
+    with ThreadPoolExecutor(max_workers=len(unique)) as ex:
+        results = dict(zip(unique, ex.map(geocode, unique.values())))
+    current_c, pickup_c, dropoff_c = (results[loc.strip().lower()] for loc in locations)
 
     geometry, distance, duration, legs = osrm_route([current_c, pickup_c, dropoff_c])
     if geometry is None:
+        # OSRM unavailable: estimate straight-line legs once and reuse them —
+        # d1 already is the distance to pickup, no second haversine needed.
         d1 = haversine(current_c["lat"], current_c["lng"], pickup_c["lat"], pickup_c["lng"])
         d2 = haversine(pickup_c["lat"], pickup_c["lng"], dropoff_c["lat"], dropoff_c["lng"])
         distance = d1 + d2
         avg_speed = 50
         duration = distance / avg_speed
-        geometry = [current_c, pickup_c, dropoff_c]
-        legs = [{"distance": d1 * 1609.34}]
-
-    distance_to_pickup = legs[0]["distance"] / 1609.34 if legs and legs[0].get("distance") else haversine(
-        current_c["lat"], current_c["lng"], pickup_c["lat"], pickup_c["lng"]
-    )
+        geometry = [[c["lat"], c["lng"]] for c in (current_c, pickup_c, dropoff_c)]
+        distance_to_pickup = d1
+    else:
+        # OSRM always returns one leg per waypoint pair.
+        distance_to_pickup = legs[0]["distance"] / 1609.34
 
     # HOS planning
     rest_stops = []
@@ -89,12 +174,17 @@ def plan_route(current, pickup, dropoff, current_cycle_used: float):
     current_miles = 0
     hours_worked = 0
     total_distance = distance
+    fuel_bucket = 0
+
+    # Invariant suffixes hoisted out of the loop; location_at only formats
+    # the mile count per call.
+    cur_suffix = " mi from " + current_c['name']
+    pk_suffix = " mi from " + pickup_c['name']
 
     def location_at(miles):
         if miles <= distance_to_pickup:
-            return f"{int(miles)} mi from {current_c['name']}"
-        else:
-            return f"{int(miles - distance_to_pickup)} mi from {pickup_c['name']}"
+            return str(int(miles)) + cur_suffix
+        return str(int(miles - distance_to_pickup)) + pk_suffix
 
     while current_miles < total_distance:
         remaining_shift_hours = min(11 - (hours_worked % 11), 14 - (hours_worked % 14))
@@ -111,7 +201,10 @@ def plan_route(current, pickup, dropoff, current_cycle_used: float):
         current_miles += drive_miles
         hours_worked += drive_miles / avg_speed
 
-        if math.floor(current_miles / 1000) > math.floor((current_miles - drive_miles) / 1000):
+        # Fuel every 1000 miles: track the bucket as an int instead of
+        # re-deriving two floor-divisions per iteration.
+        new_bucket = int(current_miles // 1000)
+        if new_bucket > fuel_bucket:
             rest_stops.append({
                 "type": "fuel",
                 "name": "Fuel Stop",
@@ -121,6 +214,7 @@ def plan_route(current, pickup, dropoff, current_cycle_used: float):
                 "time": _format_time(hours_worked),
             })
             hours_worked += 0.5
+            fuel_bucket = new_bucket
 
         if current_miles >= distance_to_pickup and (current_miles - drive_miles) < distance_to_pickup:
             rest_stops.append({
@@ -168,15 +262,21 @@ def plan_route(current, pickup, dropoff, current_cycle_used: float):
         },
         "routeGeometry": geometry,
     }
+    cache.set(cache_key, route_data, ROUTE_CACHE_TTL)
     return route_data
 
 
 def _format_time(hours: float) -> str:
-    h = int(math.floor(hours))
-    m = int(round((hours - h) * 60))
+    # Round to whole minutes once, then divmod — no floor/round calls, and
+    # unlike the old form this can never emit ':60' when minutes round up.
+    h, m = divmod(int(hours * 60 + 0.5), 60)
     return f"{h:02d}:{m:02d}"
 
 
+# Duty status -> key in the daily_hours accumulator.
+_STATUS_KEY = {"off-duty": "off", "sleeper": "sleeper", "driving": "driving"}
+
+
 def generate_eld_logs(trip_data, route_data):
     logs = []
     start_date = date.today()
@@ -204,32 +304,18 @@ def generate_eld_logs(trip_data, route_data):
             # Add portion that fits in current day
             first_duration = 24 - current_hour
             daily_segments.append({"status": status, "startHour": current_hour, "duration": first_duration, "location": location})
-            if status == "off-duty":
-                daily_hours["off"] += first_duration
-            elif status == "sleeper":
-                daily_hours["sleeper"] += first_duration
-            elif status == "driving":
-                daily_hours["driving"] += first_duration
-            else:
-                daily_hours["on"] += first_duration
-            
+            daily_hours[_STATUS_KEY.get(status, "on")] += first_duration
+
             # Save the current day
             save_day()
-            
+
             # Add remainder to new day
             remaining_duration = duration - first_duration
             if remaining_duration > 0:
                 add_segment(status, remaining_duration, location)
         else:
             daily_segments.append({"status": status, "startHour": current_hour, "duration": duration, "location": location})
-            if status == "off-duty":
-                daily_hours["off"] += duration
-            elif status == "sleeper":
-                daily_hours["sleeper"] += duration
-            elif status == "driving":
-                daily_hours["driving"] += duration
-            else:
-                daily_hours["on"] += duration
+            daily_hours[_STATUS_KEY.get(status, "on")] += duration
             current_hour += duration
 
     def save_day():
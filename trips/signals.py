@@ -0,0 +1,21 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import User
+
+# Cache key for the serialized /auth/me payload; kept here so views and
+# signal handlers agree on the format.
+ME_CACHE_KEY = 'me:{user_id}'
+ME_CACHE_TTL = 60  # seconds
+
+
+def me_cache_key(user_id) -> str:
+    return ME_CACHE_KEY.format(user_id=user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Drop the cached profile payload whenever a user row changes."""
+    cache.delete(me_cache_key(instance.pk))
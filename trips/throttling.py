@@ -0,0 +1,15 @@
+from rest_framework.throttling import AnonRateThrottle
+
+
+class LoginRateThrottle(AnonRateThrottle):
+    """Reject login bursts with a cache INCR before they reach the hasher.
+
+    Each attempt otherwise costs a full password hash, which makes a naive
+    brute force double as a CPU DoS. Keys on client IP; counters live in the
+    default cache, so with REDIS_URL set they are shared across workers.
+    """
+    scope = 'login'
+
+
+class RegisterRateThrottle(AnonRateThrottle):
+    scope = 'register'
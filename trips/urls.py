@@ -11,6 +11,7 @@ urlpatterns = [
     path('auth/change-password', auth_views.change_password, name='change-password'),
 
     path('users', auth_views.UserListCreateView.as_view(), name='users-list-create'),
+    path('users/bulk', auth_views.bulk_create_users, name='users-bulk-create'),
     path('users/<int:pk>', auth_views.UserDetailView.as_view(), name='user-detail'),
     path('users/<int:pk>/toggle-status', auth_views.toggle_user_status, name='toggle-user-status'),
 
@@ -3,6 +3,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Concat
 from django.utils import timezone
 
 from .models import Trip, Stop, ELDLog, LogSegment, User
@@ -16,6 +18,14 @@ from .serializers import (
 )
 from .services import plan_route, generate_eld_logs
 
+# Auth bookkeeping columns no serializer reads; deferred on every joined
+# User row so list queries stop dragging password hashes et al. off disk.
+_UNUSED_USER_COLS = ('password', 'last_login', 'is_superuser', 'is_staff', 'date_joined')
+
+
+def _defer_user_cols(qs, *relations):
+	return qs.defer(*[f"{rel}__{col}" for rel in relations for col in _UNUSED_USER_COLS])
+
 
 @extend_schema(
 	tags=["Trips"],
@@ -62,8 +72,10 @@ def plan_trip(request):
 			estimated_days=int(route_data.get("estimatedDays", 1) or 1),
 		)
 
-		for idx, s in enumerate(route_data.get("restStops", []), start=1):
-			Stop.objects.create(
+		# One INSERT per table instead of one per row; a multi-day trip can
+		# carry dozens of stops and segments.
+		Stop.objects.bulk_create([
+			Stop(
 				trip=trip,
 				order=idx,
 				type=s.get("type", "other"),
@@ -73,9 +85,13 @@ def plan_trip(request):
 				miles_from_start=int(s.get("milesFromStart", 0) or 0),
 				time_label=s.get("time", ""),
 			)
+			for idx, s in enumerate(route_data.get("restStops", []), start=1)
+		])
 
-		for log in eld_logs_data:
-			eld = ELDLog.objects.create(
+		# Postgres returns PKs from bulk_create, so the logs can be linked to
+		# their segments without re-querying.
+		eld_logs = ELDLog.objects.bulk_create([
+			ELDLog(
 				trip=trip,
 				date=log["date"],
 				day_number=int(log.get("dayNumber", 1)),
@@ -85,15 +101,24 @@ def plan_trip(request):
 				hours_driving=float(log["hours"]["driving"]),
 				hours_on_duty=float(log["hours"]["onDuty"]),
 			)
-			for seg in log.get("segments", []):
-				LogSegment.objects.create(
-					log=eld,
-					status=seg.get("status", "on-duty"),
-					start_hour=float(seg.get("startHour", 0)),
-					duration=float(seg.get("duration", 0)),
-					location=seg.get("location", ""),
-				)
-
+			for log in eld_logs_data
+		])
+		LogSegment.objects.bulk_create([
+			LogSegment(
+				log=eld,
+				status=seg.get("status", "on-duty"),
+				start_hour=float(seg.get("startHour", 0)),
+				duration=float(seg.get("duration", 0)),
+				location=seg.get("location", ""),
+			)
+			for eld, log in zip(eld_logs, eld_logs_data)
+			for seg in log.get("segments", [])
+		], batch_size=500)
+
+	# Serialize from one prefetched fetch; letting the serializer walk the
+	# bare instance would re-query stops, logs, and segments-per-log right
+	# after we inserted them.
+	trip = Trip.objects.select_related('driver', 'approved_by').prefetch_related('stops', 'eld_logs__segments').get(pk=trip.pk)
 	out = TripSerializer(trip)
 	return Response(out.data, status=status.HTTP_201_CREATED)
 
@@ -105,7 +130,12 @@ def plan_trip(request):
 	OpenApiParameter(name='end_date', description='Filter trips created before date', required=False, type=OpenApiTypes.DATE),
 ])
 class TripListCreateView(generics.ListCreateAPIView):
-	queryset = Trip.objects.select_related('driver', 'approved_by').prefetch_related('stops', 'eld_logs').all().order_by("-created_at")
+	queryset = _defer_user_cols(
+		Trip.objects.select_related('driver', 'approved_by').prefetch_related('stops', 'eld_logs__segments', 'eld_logs__reviewed_by'),
+		'driver', 'approved_by',
+	).annotate(
+		approved_by_full_name=Concat('approved_by__first_name', Value(' '), 'approved_by__last_name'),
+	).order_by("-created_at")
 	permission_classes = [permissions.IsAuthenticated]
 
 	def get_serializer_class(self):
@@ -147,7 +177,10 @@ class TripListCreateView(generics.ListCreateAPIView):
 
 @extend_schema(tags=["Trips"])
 class TripDetailView(generics.RetrieveUpdateDestroyAPIView):
-	queryset = Trip.objects.select_related('driver', 'approved_by').prefetch_related('stops', 'eld_logs__segments').all()
+	queryset = _defer_user_cols(
+		Trip.objects.select_related('driver', 'approved_by').prefetch_related('stops', 'eld_logs__segments', 'eld_logs__reviewed_by'),
+		'driver', 'approved_by',
+	)
 	permission_classes = [permissions.IsAuthenticated]
 
 	def get_serializer_class(self):
@@ -178,7 +211,12 @@ class LogListView(generics.ListAPIView):
 	serializer_class = ELDLogSerializer
 
 	def get_queryset(self):
-		qs = ELDLog.objects.select_related("trip", "trip__driver").prefetch_related("segments").all().order_by("-date")
+		qs = _defer_user_cols(
+			ELDLog.objects.select_related("trip__driver", "reviewed_by").prefetch_related("segments"),
+			'trip__driver', 'reviewed_by',
+		).annotate(
+			reviewed_by_full_name=Concat('reviewed_by__first_name', Value(' '), 'reviewed_by__last_name'),
+		).order_by("-date")
 		driver = self.request.query_params.get("driver")
 		trip_id = self.request.query_params.get("trip")
 		start = self.request.query_params.get("start")
@@ -196,7 +234,10 @@ class LogListView(generics.ListAPIView):
 
 @extend_schema(tags=["Logs"])
 class LogDetailView(generics.RetrieveUpdateDestroyAPIView):
-	queryset = ELDLog.objects.select_related("trip", "trip__driver").prefetch_related("segments").all()
+	queryset = _defer_user_cols(
+		ELDLog.objects.select_related("trip__driver", "reviewed_by").prefetch_related("segments"),
+		'trip__driver', 'reviewed_by',
+	)
 	serializer_class = ELDLogSerializer
 	permission_classes = [permissions.IsAuthenticated]
 
@@ -237,9 +278,11 @@ def submit_trip(request, pk):
 		return Response({'error': f'Can only submit draft trips. Current status: {trip.status}'}, status=status.HTTP_400_BAD_REQUEST)
 
 	trip.status = 'pending'
+	update_fields = ['status', 'updated_at']
 	if request.data.get('notes'):
 		trip.notes = request.data['notes']
-	trip.save()
+		update_fields.append('notes')
+	trip.save(update_fields=update_fields)
 
 	return Response(TripSerializer(trip).data)
 
@@ -268,9 +311,11 @@ def approve_trip(request, pk):
 	trip.status = 'approved'
 	trip.approved_by = request.user
 	trip.approved_at = timezone.now()
+	update_fields = ['status', 'approved_by', 'approved_at', 'updated_at']
 	if request.data.get('notes'):
 		trip.notes = request.data['notes']
-	trip.save()
+		update_fields.append('notes')
+	trip.save(update_fields=update_fields)
 
 	return Response(TripSerializer(trip).data)
 
@@ -297,9 +342,11 @@ def reject_trip(request, pk):
 		return Response({'error': f'Can only reject pending trips. Current status: {trip.status}'}, status=status.HTTP_400_BAD_REQUEST)
 
 	trip.status = 'draft'
+	update_fields = ['status', 'updated_at']
 	if request.data.get('notes'):
 		trip.notes = request.data['notes']
-	trip.save()
+		update_fields.append('notes')
+	trip.save(update_fields=update_fields)
 
 	return Response(TripSerializer(trip).data)
 
@@ -326,7 +373,7 @@ def start_trip(request, pk):
 		return Response({'error': f'Can only start approved trips. Current status: {trip.status}'}, status=status.HTTP_400_BAD_REQUEST)
 
 	trip.status = 'in_progress'
-	trip.save()
+	trip.save(update_fields=['status', 'updated_at'])
 
 	return Response(TripSerializer(trip).data)
 
@@ -353,7 +400,7 @@ def complete_trip(request, pk):
 		return Response({'error': f'Can only complete in-progress trips. Current status: {trip.status}'}, status=status.HTTP_400_BAD_REQUEST)
 
 	trip.status = 'completed'
-	trip.save()
+	trip.save(update_fields=['status', 'updated_at'])
 
 	return Response(TripSerializer(trip).data)
 
@@ -380,9 +427,11 @@ def cancel_trip(request, pk):
 			return Response({'error': 'Drivers can only cancel draft or pending trips.'}, status=status.HTTP_400_BAD_REQUEST)
 
 	trip.status = 'cancelled'
+	update_fields = ['status', 'updated_at']
 	if request.data.get('notes'):
 		trip.notes = request.data['notes']
-	trip.save()
+		update_fields.append('notes')
+	trip.save(update_fields=update_fields)
 
 	return Response(TripSerializer(trip).data)
 
@@ -405,16 +454,25 @@ def submit_logs(request):
 	serializer.is_valid(raise_exception=True)
 
 	log_ids = serializer.validated_data['log_ids']
-	logs = ELDLog.objects.filter(id__in=log_ids, trip__driver=request.user, submission_status='draft')
 
-	if not logs.exists():
-		return Response({'error': 'No eligible draft logs found for submission.'}, status=status.HTTP_400_BAD_REQUEST)
+	# Lock and collect the eligible ids once, then update by id: two queries
+	# instead of exists/update/count/values_list, and no window where a
+	# concurrent submit makes the answers disagree. (Re-evaluating the draft
+	# filter after the update also used to report 0 submitted logs.)
+	with transaction.atomic():
+		submitted_ids = list(
+			ELDLog.objects.filter(id__in=log_ids, trip__driver=request.user, submission_status='draft')
+			.select_for_update()
+			.values_list('id', flat=True)
+		)
+		if not submitted_ids:
+			return Response({'error': 'No eligible draft logs found for submission.'}, status=status.HTTP_400_BAD_REQUEST)
 
-	logs.update(submission_status='submitted', submitted_at=timezone.now())
+		ELDLog.objects.filter(id__in=submitted_ids).update(submission_status='submitted', submitted_at=timezone.now())
 
 	return Response({
-		'message': f'{logs.count()} log(s) submitted successfully.',
-		'submitted_logs': list(logs.values_list('id', flat=True))
+		'message': f'{len(submitted_ids)} log(s) submitted successfully.',
+		'submitted_logs': submitted_ids
 	})
 
 